@@ -1,12 +1,87 @@
 import argparse
+import base64
+import collections
 import json
 import os
+import re
 import sys
 import tempfile
+import threading
 import time
 import zipfile
-from github import Github, BadCredentialsException, UnknownObjectException
+from concurrent.futures import ThreadPoolExecutor
+from github import Github, GithubException, BadCredentialsException, \
+    UnknownObjectException
 from socket import error as SocketError
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlencode
+from urllib.request import Request, urlopen
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_dumps(data, pretty=False):
+    """
+    Serializes the data to JSON using orjson when it is available
+
+    :param data: Object to be serialized
+    :param pretty: Indents the result and sorts the keys
+    :return: bytes With the encoded data
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS if pretty else 0
+        return orjson.dumps(data, option=option)
+    if pretty:
+        return json.dumps(data, indent=2, sort_keys=True,
+                          ensure_ascii=False).encode('utf-8')
+    return json.dumps(data).encode('utf-8')
+
+
+def _json_loads(data):
+    """
+    Deserializes the JSON data using orjson when it is available
+
+    :param data: bytes With the encoded data
+    :return: Object decoded
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+
+def _parse_last_page(link):
+    """
+    Returns the number of the last page from the Link header of a
+    paginated response
+
+    :param link: String with the Link header or None
+    :return: int With the last page, 1 if the response has one page
+    """
+    match = re.search(r'[?&]page=(\d+)[^>]*>; rel="last"', link or '')
+    return int(match.group(1)) if match else 1
+
+
+def _get_retry_after(headers, data):
+    """
+    GitHub answers the bursts of concurrent requests with a secondary
+    rate limit 403 while there are requests remaining, asking to wait
+    Retry-After seconds, or a minute when the header is missing
+
+    :param headers: Headers of the 403 response or None
+    :param data: Decoded body of the 403 response
+    :return: int With the seconds to wait, None if it isn't a rate limit
+    """
+    for header, value in (headers or {}).items():
+        if header.lower() == 'retry-after':
+            return int(value)
+    message = data.get('message', '') if isinstance(data, dict) else ''
+    if 'secondary rate limit' in message.lower() \
+            or 'abuse' in message.lower():
+        return 60
+    return None
 
 
 class GitHubExport:
@@ -15,7 +90,15 @@ class GitHubExport:
     the milestones, issues, pull requests and comments.
     """
     per_page = 100
+    fetch_workers = 8
+    comment_workers = 16
+    max_requests = 16
+    read_workers = 32
+    write_buffer_size = 1 << 20
+    max_retries = 3
+    retry_backoff = 0.3
     retrieve_temp = True
+    temp_subdir = None
     state = 'all'
 
     def print_json(self):
@@ -25,7 +108,7 @@ class GitHubExport:
         :return: None
         """
         print(
-            json.dumps(self.get_milestones(), indent=4, sort_keys=True)
+            _json_dumps(self.get_milestones(), pretty=True).decode('utf-8')
         )
 
     def create_zipfile(self):
@@ -36,15 +119,14 @@ class GitHubExport:
         :return: None
         """
         filename = 'GitHubExport-{}'.format(time.strftime('%Y%m%d-%H%M%S'))
-        path_file = os.path.join(tempfile.gettempdir(),
-                                 '{}.json'.format(filename))
-
-        with open(path_file, 'w') as outfile:
-            json.dump(self.get_milestones(), outfile)
 
-        zf = zipfile.ZipFile('{}.zip'.format(filename), 'w')
-        zf.write(path_file, '{}.json'.format(filename))
-        zf.close()
+        payload = _json_dumps(self.get_milestones())
+        with open('{}.zip'.format(filename), 'wb',
+                  buffering=self.write_buffer_size) as outfile:
+            with zipfile.ZipFile(outfile, 'w', zipfile.ZIP_DEFLATED,
+                                 compresslevel=1) as zf:
+                with zf.open('{}.json'.format(filename), 'w') as member:
+                    member.write(payload)
 
     def get_milestones(self):
         """
@@ -76,7 +158,9 @@ class GitHubExport:
         issues_list = []
         pulls_list = []
         for issue in all_issues:
-            if not issue.pull_request:
+            # The list payload already has the pull_request key, reading the
+            # raw data skips the PyGithub attribute completion
+            if not issue._rawData.get('pull_request'):
                 issues_list.append(issue)
             else:
                 pulls_list.append(issue)
@@ -90,13 +174,15 @@ class GitHubExport:
         :param issue: IssueObject Of the related issue
         :return: list Will return a list of comments
         """
-        self._check_rate_limit()
         comments = issue.get_comments()
-        return self._fetch_all(comments, True)
+        # The issue payload has the number of comments, so the pages are
+        # known without requesting the first one
+        total = issue._rawData.get('comments')
+        return self._fetch_all(comments, True,
+                               total if isinstance(total, int) else None)
 
     def _get_temp_dir(self):
-        return os.path.join(tempfile.gettempdir(), self.organization,
-                            self.repository)
+        return self._temp_dir
 
     def _build_raw_issues(self, issues):
         """
@@ -107,22 +193,45 @@ class GitHubExport:
         comments
         :return: list With all the issues as a Dictionary
         """
-        raw_issues = []
+        # The issues already built on this export are reused, so an issue
+        # repeated between the pages or the milestones is only fetched once
+        issues_ids = [self._get_id(issue) for issue in issues]
+        new_ids = [issue_id for issue_id in issues_ids
+                   if issue_id not in self._raw_issues]
+        self._raw_issues.update(self._get_temp_files(new_ids, 'issue'))
+        uncached_issues = {
+            issue_id: issue for issue_id, issue in zip(issues_ids, issues)
+            if issue_id not in self._raw_issues
+        }
 
-        for issue in issues:
-            stored_object = self._get_temp_file(issue.id, 'issue')
-            if stored_object:
-                raw_issues.append(stored_object)
-                continue
+        with ThreadPoolExecutor(max_workers=self.comment_workers) as executor:
+            built_issues = executor.map(self._build_raw_issue,
+                                        uncached_issues.values())
+            for issue_id, raw_issue in zip(uncached_issues, built_issues):
+                self._raw_issues[issue_id] = raw_issue
+                self._set_temp_file(issue_id, 'issue', raw_issue)
 
-            raw_issue = issue.raw_data
-            raw_issue.update({
-                'comments': self.get_comments(issue)
-            })
-            raw_issues.append(raw_issue)
-            self._set_temp_file(issue.id, 'issue', raw_issue)
+        return [self._raw_issues[issue_id] for issue_id in issues_ids]
+
+    def _build_raw_issue(self, issue):
+        """
+        Will return the issue with the comments as a Dictionary, the
+        raw data is read once so a lazy issue is only completed once
 
-        return raw_issues
+        :param issue: IssueObject to be updated with comments
+        :return: dict With the issue data
+        """
+        raw_issue = self._get_raw_data(issue)
+        # The payload has the number of comments, so the comments are only
+        # requested when the issue has any
+        if raw_issue.get('comments') == 0:
+            comments = []
+        else:
+            comments = self.get_comments(issue)
+        raw_issue.update({
+            'comments': comments
+        })
+        return raw_issue
 
     def _build_raw_milestones(self, milestones):
         """
@@ -134,22 +243,24 @@ class GitHubExport:
         :return: list With all the milestones as a Dictionary
         """
         raw_milestones = []
+        milestones_ids = [self._get_id(milestone) for milestone in milestones]
+        stored_milestones = self._get_temp_files(milestones_ids, 'milestone')
 
         for i, milestone in enumerate(milestones):
-            milestone_id = milestone.id if hasattr(milestone, 'id') else None
-            stored_object = self._get_temp_file(milestone_id, 'milestone')
+            milestone_id = milestones_ids[i]
+            stored_object = stored_milestones.get(milestone_id)
             if stored_object:
                 raw_milestones.append(stored_object)
                 continue
 
-            self._display_percentage((i+1)*100/len(milestones))
-            issues, pulls = self.get_issues_and_pulls(milestone)
+            self._display_percentage((i+1)*100//len(milestones))
             if milestone != 'none':
-                raw_milestone = milestone.raw_data
+                raw_milestone = self._get_raw_data(milestone)
             else:
                 raw_milestone = {
                     'id': milestone_id
                 }
+            issues, pulls = self.get_issues_and_pulls(milestone)
             raw_milestone.update({
                 'issues': self._build_raw_issues(issues),
                 'pulls': self._build_raw_issues(pulls)
@@ -159,82 +270,376 @@ class GitHubExport:
 
         return raw_milestones
 
+    @staticmethod
+    def _get_id(obj):
+        return obj.id if hasattr(obj, 'id') else None
+
+    def _get_raw_data(self, obj):
+        # Reading the raw data of a lazy object completes it with a request
+        return self._call_api(lambda: obj.raw_data)
+
+    def _get_temp_path(self, obj_id, obj_type):
+        # The files are sharded by the last byte of the id to keep the
+        # directories small, the milestone without id goes to the shard 00
+        shard = '{:02x}'.format((obj_id or 0) & 0xFF)
+        return os.path.join(self._get_temp_dir(), obj_type, shard,
+                            '{}.json'.format(obj_id))
+
+    def _index_temp_files(self):
+        # Keeps the ids stored on the temp directory in memory, so looking
+        # for an object that isn't stored doesn't touch the file system
+        self._cached_ids = collections.defaultdict(set)
+        for obj_type, file_name in self._walk_temp_files():
+            self._cached_ids[obj_type].add(
+                os.path.basename(file_name)[:-len('.json')]
+            )
+
+    def _walk_temp_files(self):
+        # Only the directories of each type are walked, so the cache of the
+        # RawExporter stored on a sub directory is kept apart
+        for obj_type in ('milestone', 'issue'):
+            type_dir = os.path.join(self._get_temp_dir(), obj_type)
+            for root, dirs, files in os.walk(type_dir):
+                for f in files:
+                    if f.endswith('.json'):
+                        yield obj_type, os.path.join(root, f)
+
     def _get_temp_file(self, obj_id, obj_type):
         if self.retrieve_temp:
-            file_name = os.path.join(self._get_temp_dir(), '{}-{}.json'.format(obj_type, obj_id))
-            if os.path.isfile(file_name):
-                with open(file_name) as json_file:
-                    return json.load(json_file)
-            else:
+            if str(obj_id) not in self._cached_ids[obj_type]:
                 return None
+            file_name = self._get_temp_path(obj_id, obj_type)
+            with open(file_name, 'rb') as json_file:
+                return _json_loads(json_file.read())
+
+    def _get_temp_files(self, obj_ids, obj_type):
+        """
+        Reads concurrently all the passed objects stored on the
+        temp directory
+
+        :param obj_ids: List of ids of the objects to be read
+        :param obj_type: String with the type of the objects
+        :return: dict With the stored objects by id
+        """
+        if not self.retrieve_temp:
+            return {}
+        stored_ids = [obj_id for obj_id in obj_ids
+                      if str(obj_id) in self._cached_ids[obj_type]]
+        with ThreadPoolExecutor(max_workers=self.read_workers) as executor:
+            return dict(zip(stored_ids, executor.map(
+                lambda obj_id: self._get_temp_file(obj_id, obj_type),
+                stored_ids
+            )))
 
     def _set_temp_file(self, obj_id, obj_type, data):
         if self.retrieve_temp:
-            file_name = os.path.join(self._get_temp_dir(), '{}-{}.json'.format(obj_type, obj_id))
-            if not os.path.exists(self._get_temp_dir()):
-                os.makedirs(self._get_temp_dir())
-            with open(file_name, 'w') as outfile:
-                json.dump(data, outfile)
-
-    def _fetch_all(self, obj, raw_data=False):
+            file_name = self._get_temp_path(obj_id, obj_type)
+            os.makedirs(os.path.dirname(file_name), exist_ok=True)
+            payload = _json_dumps(data)
+            with open(file_name, 'wb',
+                      buffering=self.write_buffer_size) as outfile:
+                outfile.write(payload)
+            self._cached_ids[obj_type].add(str(obj_id))
+
+    def _fetch_all(self, obj, raw_data=False, total=None):
         """
-        Fetch all the pages of the GitHub repository
+        Fetch all the pages of the GitHub repository. When the number of
+        items is known the pages it fills are requested at once, otherwise
+        the first page is requested alone. While the last page is full the
+        next ones are requested concurrently, doubling the batch up to
+        fetch_workers, so a count that is already stale loses no items
 
         :param obj: PaginatedList to be fetched
         :param raw_data: Creates an object from raw_data previously obtained
+        :param total: Number of items of the list if it is already known,
+        only used to size the first batch of pages
         :return: list Of GitHubObjects or Objects with data
         """
-        data = []
-        i = 0
-        last_page = False
+        if total is None:
+            pages_data = [self._get_page(obj, 0)]
+        else:
+            pages = max(1, (total + self.per_page - 1) // self.per_page)
+            pages_data = self._get_pages(obj, range(pages))
+        batch_size = 1
 
-        while not last_page:
-            j = 0
-            self._check_rate_limit()
-            try:
-                page_data = obj.get_page(i)
-            except TypeError:
-                last_page = True
-            while j < self.per_page and not last_page:
-                try:
-                    if raw_data:
-                        data.append(page_data[j].raw_data)
-                    else:
-                        data.append(page_data[j])
-                except IndexError:
-                    last_page = True
-                j += 1
-            i += 1
+        while len(pages_data[-1]) == self.per_page:
+            next_page = len(pages_data)
+            pages_data.extend(self._get_pages(
+                obj, range(next_page, next_page + batch_size)
+            ))
+            batch_size = min(batch_size * 2, self.fetch_workers)
+
+        data = []
+        for page_data in pages_data:
+            data.extend(self._get_raw_data(p) if raw_data else p
+                        for p in page_data)
 
         return data
 
-    @staticmethod
-    def _display_percentage(progress):
-        sys.stdout.write('\r[{}] {}%'.format('#'*(progress/2), progress))
+    def _get_pages(self, obj, pages):
+        if len(pages) == 1:
+            return [self._get_page(obj, pages[0])]
+        with ThreadPoolExecutor(max_workers=self.fetch_workers) as executor:
+            return list(executor.map(lambda i: self._get_page(obj, i), pages))
+
+    def _get_page(self, obj, page):
+        try:
+            return self._call_api(obj.get_page, page)
+        except TypeError:
+            # Same as an empty page, PyGithub can fail past the last one
+            return []
+
+    def _call_api(self, func, *args):
+        # Every call that can send a request goes through here. PyGithub
+        # keeps the rate limit updated from the response headers, so instead
+        # of polling it the call is retried once the limit is reset.
+        # Connection and gateway errors are retried with a backoff
+        attempt = 0
+        while True:
+            try:
+                with self._api_slots:
+                    return func(*args)
+            except GithubException as e:
+                if e.status == 403 and self.gitHub.rate_limiting[0] <= 0:
+                    self._wait_rate_limit_reset()
+                    continue
+                retry_after = _get_retry_after(getattr(e, 'headers', None),
+                                               e.data)
+                if e.status == 403 and retry_after is not None:
+                    self._wait_rate_limit_reset(time.time() + retry_after)
+                    continue
+                if e.status not in (502, 503, 504) \
+                        or attempt >= self.max_retries:
+                    raise
+            except SocketError:
+                if attempt >= self.max_retries:
+                    raise
+            time.sleep(self.retry_backoff * 2 ** attempt)
+            attempt += 1
+
+    def _display_percentage(self, progress):
+        # Only redraws the bar when the integer percentage changes
+        if progress == self._last_percentage:
+            return
+        self._last_percentage = progress
+        sys.stdout.write('\r[{:<50}] {}%'.format('#'*(progress//2), progress))
         sys.stdout.flush()
 
     def _check_rate_limit(self):
         # Prevents that the server gets down by all the consumed data
         remaining, limit = self.gitHub.rate_limiting
-        if abs(remaining) < 100:
-            time.sleep(60 * 2)
+        if remaining < 100:
+            self._wait_rate_limit_reset()
+
+    def _wait_rate_limit_reset(self, reset=None):
+        # The lock keeps the rest of the workers waiting while one is sleeping
+        with self._rate_limit_lock:
+            if reset is None:
+                reset = self.gitHub.rate_limiting_resettime
+            time.sleep(max(0, reset - time.time()) + 1)
 
     def clean_temp(self):
-        if os.path.exists(self._get_temp_dir()):
-            files = [f for f in os.listdir(self._get_temp_dir()) if f.endswith('.json')]
-            for f in files:
-                os.remove(f)
+        for obj_type, file_name in list(self._walk_temp_files()):
+            os.unlink(file_name)
+        # Files left by the flat layout used before the sharding
+        if os.path.isdir(self._get_temp_dir()):
+            with os.scandir(self._get_temp_dir()) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.json') and entry.is_file():
+                        os.unlink(entry.path)
+        self._cached_ids.clear()
 
     def __init__(self, login_or_token, organization, repository,
                  password=None):
         self.organization = organization
         self.repository = repository
+        self._rate_limit_lock = threading.Lock()
+        # Caps the requests sent at the same time by all the nested workers
+        self._api_slots = threading.BoundedSemaphore(self.max_requests)
+        self._last_percentage = None
+        self._raw_issues = {}
+        self._temp_dir = os.path.join(tempfile.gettempdir(), organization,
+                                      repository)
+        if self.temp_subdir:
+            self._temp_dir = os.path.join(self._temp_dir, self.temp_subdir)
+        self._cached_ids = collections.defaultdict(set)
+        if self.retrieve_temp:
+            os.makedirs(self._temp_dir, exist_ok=True)
+            self._index_temp_files()
         repo_name = '{}/{}'.format(organization, repository)
 
         self.gitHub = Github(login_or_token, password, per_page=self.per_page)
         self.repo = self.gitHub.get_repo(repo_name)
 
 
+class RawExporter(GitHubExport):
+    """
+    Exports the GitHub project calling the REST API directly, the data is
+    kept as the decoded JSON instead of building a PyGithub object for
+    each milestone, issue and comment. PyGithub is only used to validate
+    the repository and to discover the rate limit.
+
+    The list payloads have less fields than the objects PyGithub completes,
+    so the temp files are stored apart, on the raw sub directory.
+    """
+    timeout = 10
+    temp_subdir = 'raw'
+
+    def get_milestones(self):
+        """
+        Will return a dictionary with all the milestones with issues
+        and pull requests
+
+        :return: dictionary With all the milestones including
+        issues and pull requests without a milestone associated
+        """
+        self._check_rate_limit()
+        milestones = self._fetch_all_raw(
+            '{}/milestones'.format(self._repo_url), {'state': self.state}
+        )
+        milestones.append('none')
+
+        return {
+            'milestones': self._build_raw_milestones(milestones)
+        }
+
+    def get_issues_and_pulls(self, milestone):
+        """
+        Fetch all the issues and pull requests of the passed milestone
+
+        :param milestone: dict or String of the related milestone
+        :return: [list, list] Will return all the issues and pull requests
+        """
+        self._check_rate_limit()
+        number = milestone if milestone == 'none' else milestone['number']
+        all_issues = self._fetch_all_raw(
+            '{}/issues'.format(self._repo_url),
+            {'milestone': number, 'state': self.state}
+        )
+        issues_list = []
+        pulls_list = []
+        for issue in all_issues:
+            if not issue.get('pull_request'):
+                issues_list.append(issue)
+            else:
+                pulls_list.append(issue)
+
+        return issues_list, pulls_list
+
+    def get_comments(self, issue):
+        """
+        Fetch all the comments of the passed issue
+
+        :param issue: dict Of the related issue
+        :return: list Will return a list of comments
+        """
+        return self._fetch_all_raw(issue['comments_url'])
+
+    @staticmethod
+    def _get_id(obj):
+        return obj['id'] if isinstance(obj, dict) else None
+
+    @staticmethod
+    def _get_raw_data(obj):
+        return obj
+
+    def _fetch_all_raw(self, url, params=None):
+        """
+        Fetch all the pages of the passed API url, the first page tells
+        through the Link header how many pages are left, and those are
+        requested concurrently
+
+        :param url: String with the API url of the list
+        :param params: dict With the query parameters
+        :return: list With all the items decoded
+        """
+        params = dict(params or {}, per_page=self.per_page)
+        data, headers = self._request(url, dict(params, page=1))
+        last_page = _parse_last_page(headers.get('Link'))
+        if last_page <= 1:
+            return data
+
+        with ThreadPoolExecutor(max_workers=self.fetch_workers) as executor:
+            pages_data = executor.map(
+                lambda page: self._request(url, dict(params, page=page))[0],
+                range(2, last_page + 1)
+            )
+            for page_data in pages_data:
+                data.extend(page_data)
+
+        return data
+
+    def _request(self, url, params=None):
+        # The rate limit and the connection errors are handled the same way
+        # as _call_api does for the PyGithub requests, a stalled connection
+        # times out as PyGithub's requester does and is retried
+        if params:
+            url = '{}?{}'.format(url, urlencode(params))
+        request = Request(url, headers=self._headers)
+        attempt = 0
+        while True:
+            try:
+                with self._api_slots, \
+                        urlopen(request, timeout=self.timeout) as response:
+                    self._update_rate_limit(response.headers)
+                    return _json_loads(response.read()), response.headers
+            except HTTPError as e:
+                if e.code == 403 \
+                        and e.headers.get('X-RateLimit-Remaining') == '0':
+                    self._wait_rate_limit_reset(
+                        int(e.headers['X-RateLimit-Reset'])
+                    )
+                    continue
+                if e.code == 403:
+                    try:
+                        data = _json_loads(e.read())
+                    except ValueError:
+                        data = None
+                    retry_after = _get_retry_after(e.headers, data)
+                    if retry_after is not None:
+                        self._wait_rate_limit_reset(time.time() + retry_after)
+                        continue
+                if e.code not in (502, 503, 504) \
+                        or attempt >= self.max_retries:
+                    raise
+            except (URLError, SocketError):
+                if attempt >= self.max_retries:
+                    raise
+            time.sleep(self.retry_backoff * 2 ** attempt)
+            attempt += 1
+
+    def _update_rate_limit(self, headers):
+        # The requests don't go through PyGithub, so the rate limit is kept
+        # from the headers of the responses
+        if 'X-RateLimit-Remaining' in headers:
+            self._rate_limit = (int(headers['X-RateLimit-Remaining']),
+                                int(headers['X-RateLimit-Reset']))
+
+    def _check_rate_limit(self):
+        remaining, reset = self._rate_limit
+        if remaining < 100:
+            self._wait_rate_limit_reset(reset)
+
+    def __init__(self, login_or_token, organization, repository,
+                 password=None):
+        super().__init__(login_or_token, organization, repository, password)
+        self._repo_url = self.repo.url
+        self._rate_limit = (self.gitHub.rate_limiting[0],
+                            self.gitHub.rate_limiting_resettime)
+        if password is not None:
+            credentials = '{}:{}'.format(login_or_token, password)
+            authorization = 'Basic {}'.format(
+                base64.b64encode(credentials.encode('utf-8')).decode('ascii')
+            )
+        else:
+            authorization = 'token {}'.format(login_or_token)
+        self._headers = {
+            'Accept': 'application/vnd.github.v3+json',
+            'Authorization': authorization,
+            'User-Agent': 'GitHubExport'
+        }
+
+
 def main():
     """Main entry point for the script."""
     parser = argparse.ArgumentParser(
@@ -256,10 +661,14 @@ def main():
                         help='Prints JSON result')
     parser.add_argument('--clean_temp', action='store_true', default=False,
                         help='Clear all files on the temporary directory')
+    parser.add_argument('--raw', action='store_true', default=False,
+                        help='Fetch the data directly from the REST API '
+                             'without building PyGithub objects')
     args = parser.parse_args()
 
-    g = GitHubExport(args.user_token, args.owner, args.repository,
-                     args.password)
+    exporter = RawExporter if args.raw else GitHubExport
+    g = exporter(args.user_token, args.owner, args.repository,
+                 args.password)
 
     if args.clean_temp:
         g.clean_temp()
@@ -272,6 +681,15 @@ def main():
         print('Error: Incorrect credentials')
     except UnknownObjectException:
         print('Error: Incorrect GitHub owner or repository')
+    except HTTPError as e:
+        # The errors of the --raw requests, the rate limit 403s are retried
+        # so a 403 reaching here means the credentials have no access
+        if e.code in (401, 403):
+            print('Error: Incorrect credentials')
+        elif e.code == 404:
+            print('Error: Incorrect GitHub owner or repository')
+        else:
+            raise
 
 
 if __name__ == '__main__':